@@ -162,6 +162,7 @@ test = {
     "pytest==7.0.0",
     "pytest-cov",
     "pytest-order",
+    "pytest-xdist",
     "faker",
     "coverage",
     # sklearn integration
@@ -13,23 +13,77 @@
 Abstract class for AWS based secrets manager implementations
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import RLock
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
 
 from metadata.clients.aws_client import AWSClient
 from metadata.generated.schema.entity.services.connections.metadata.secretsManagerProvider import (
     SecretsManagerProvider,
 )
 from metadata.utils.logger import utils_logger
+from metadata.utils.lru_cache import LRUCache
 from metadata.utils.secrets.external_secrets_manager import ExternalSecretsManager
 
 logger = utils_logger()
 
 NULL_VALUE = "null"
 
+MAX_WORKERS = 8
+
+CACHE_MAX_SIZE = 256
+CACHE_TTL = 300  # seconds
+
+AWS_CREDENTIALS_FIELDS = (
+    "awsAccessKeyId",
+    "awsSecretAccessKey",
+    "awsSessionToken",
+    "awsRegion",
+    "endPointURL",
+)
+
+
+def _get_credentials_key(credentials: Optional["AWSCredentials"]) -> Optional[Tuple]:
+    """
+    Build a hashable key out of the AWS credentials to be used for caching
+    """
+    config = AWSClient(credentials).config
+    if config is None:
+        return None
+    secret_access_key = (
+        config.awsSecretAccessKey.get_secret_value()
+        if config.awsSecretAccessKey
+        else None
+    )
+    return (
+        config.awsAccessKeyId,
+        secret_access_key,
+        config.awsSessionToken,
+        config.awsRegion,
+        config.endPointURL,
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_client(credentials_key: Optional[Tuple], client_name: str):
+    """
+    Build the boto3 client only once per credentials and client name.
+    boto3 clients are thread safe, so they can be shared between instances.
+    """
+    credentials = (
+        dict(zip(AWS_CREDENTIALS_FIELDS, credentials_key)) if credentials_key else None
+    )
+    return AWSClient(credentials).get_client(client_name)
+
 
 class AWSBasedSecretsManager(ExternalSecretsManager, ABC):
     """
     AWS Secrets Manager class
+
+    Retrieved values are kept in a local cache for `CACHE_TTL` seconds
+    to avoid repeated API requests for the same secret.
     """
 
     def __init__(
@@ -39,11 +93,87 @@ class AWSBasedSecretsManager(ExternalSecretsManager, ABC):
         provider: SecretsManagerProvider,
     ):
         super().__init__(provider)
-        self.client = AWSClient(credentials).get_client(client)
+        self.client = _build_client(_get_credentials_key(credentials), client)
+        self._cache = LRUCache(CACHE_MAX_SIZE)
+        self._cache_lock = RLock()
+
+    def _get_cached_values(self, secret_ids: List[str]) -> Dict[str, str]:
+        """
+        :param secret_ids: The secret ids to look for in the cache
+        :return: The non expired cached value of each secret found
+        """
+        now = monotonic()
+        values = {}
+        with self._cache_lock:
+            for secret_id in secret_ids:
+                if secret_id in self._cache:
+                    expires_at, value = self._cache.get(secret_id)
+                    if expires_at > now:
+                        values[secret_id] = value
+        return values
+
+    def _cache_values(self, values: Dict[str, str]) -> None:
+        expires_at = monotonic() + CACHE_TTL
+        with self._cache_lock:
+            for secret_id, value in values.items():
+                self._cache.put(secret_id, (expires_at, value))
 
-    @abstractmethod
     def get_string_value(self, secret_id: str) -> str:
         """
         :param secret_id: The secret id to retrieve
+        :return: The value of the secret, from the local cache if present
+        """
+        cached = self._get_cached_values([secret_id])
+        if secret_id in cached:
+            return cached[secret_id]
+        return self.refresh_now(secret_id)
+
+    def get_string_values(self, secret_ids: List[str]) -> Dict[str, str]:
+        """
+        Retrieve several secrets at once, only requesting the ones
+        not present in the local cache.
+        :param secret_ids: The secret ids to retrieve
+        :return: The value of each secret by secret id
+        """
+        unique_secret_ids = list(dict.fromkeys(secret_ids))
+        values = self._get_cached_values(unique_secret_ids)
+        missing = [
+            secret_id for secret_id in unique_secret_ids if secret_id not in values
+        ]
+        if missing:
+            fetched = self._get_string_values(missing)
+            self._cache_values(fetched)
+            values.update(fetched)
+        return values
+
+    def refresh_now(self, secret_id: str) -> str:
+        """
+        Retrieve the secret skipping the local cache, e.g. after a rotation,
+        and store the new value in the cache.
+        :param secret_id: The secret id to retrieve
         :return: The value of the secret
         """
+        value = self._get_string_value(secret_id)
+        self._cache_values({secret_id: value})
+        return value
+
+    @abstractmethod
+    def _get_string_value(self, secret_id: str) -> str:
+        """
+        Retrieve the secret from the provider
+        :param secret_id: The secret id to retrieve
+        :return: The value of the secret
+        """
+
+    def _get_string_values(self, secret_ids: List[str]) -> Dict[str, str]:
+        """
+        Retrieve several secrets from the provider. By default, secrets are
+        fetched concurrently one by one. Implementations can override it if
+        the provider exposes a batch API.
+        :param secret_ids: The secret ids to retrieve
+        :return: The value of each secret by secret id
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return dict(
+                zip(secret_ids, executor.map(self._get_string_value, secret_ids))
+            )
@@ -35,7 +35,7 @@ class AWSSecretsManager(AWSBasedSecretsManager):
     def __init__(self, credentials: Optional["AWSCredentials"]):
         super().__init__(credentials, "secretsmanager", SecretsManagerProvider.aws)
 
-    def get_string_value(self, secret_id: str) -> str:
+    def _get_string_value(self, secret_id: str) -> str:
         """
         :param secret_id: The secret id to retrieve. Current stage is always retrieved.
         :return: The value of the secret. When the secret is a string, the value is
@@ -13,7 +13,7 @@
 Secrets manager implementation using AWS SSM Parameter Store
 """
 import traceback
-from typing import Optional
+from typing import Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
@@ -26,6 +26,9 @@ from metadata.utils.secrets.aws_based_secrets_manager import (
 )
 from metadata.utils.secrets.secrets_manager import logger
 
+# Max number of parameters allowed by a single GetParameters call
+GET_PARAMETERS_MAX_NAMES = 10
+
 
 class AWSSSMSecretsManager(AWSBasedSecretsManager):
     """
@@ -35,7 +38,7 @@ class AWSSSMSecretsManager(AWSBasedSecretsManager):
     def __init__(self, credentials: Optional["AWSCredentials"]):
         super().__init__(credentials, "ssm", SecretsManagerProvider.aws)
 
-    def get_string_value(self, secret_id: str) -> str:
+    def _get_string_value(self, secret_id: str) -> str:
         """
         :param secret_id: The parameter name to retrieve.
         :return: The value of the parameter. When the parameter is not present, it throws a `ValueError` exception.
@@ -61,3 +64,38 @@ class AWSSSMSecretsManager(AWSBasedSecretsManager):
             raise ValueError(
                 f"Parameter for parameter name [{secret_id}] not present in the response."
             )
+
+    def _get_string_values(self, secret_ids: List[str]) -> Dict[str, str]:
+        """
+        :param secret_ids: The parameter names to retrieve. They are fetched in batches using `GetParameters`.
+        :return: The value of each parameter by parameter name. When any of the parameters is not present,
+                 it throws a `ValueError` exception.
+        """
+        if any(secret_id is None for secret_id in secret_ids):
+            raise ValueError("[names] argument contains None")
+
+        names = list(dict.fromkeys(secret_ids))
+        values = {}
+        for index in range(0, len(names), GET_PARAMETERS_MAX_NAMES):
+            batch = names[index : index + GET_PARAMETERS_MAX_NAMES]
+            try:
+                kwargs = {"Names": batch, "WithDecryption": True}
+                response = self.client.get_parameters(**kwargs)
+                logger.debug("Got values for parameters %s.", batch)
+            except ClientError as err:
+                logger.debug(traceback.format_exc())
+                logger.error(f"Couldn't get values for parameters {batch}: {err}")
+                raise err
+            for parameter in response.get("Parameters", []):
+                # versioned or labeled names, e.g. `/app/db:2`, come back with
+                # the `:2` in `Selector` instead of `Name`
+                name = parameter["Name"] + parameter.get("Selector", "")
+                values[name] = (
+                    parameter["Value"] if parameter["Value"] != NULL_VALUE else None
+                )
+            missing = [name for name in batch if name not in values]
+            if missing:
+                raise ValueError(
+                    f"Parameters for parameter names {missing} not present in the response."
+                )
+        return values
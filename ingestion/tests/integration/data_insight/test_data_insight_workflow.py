@@ -16,12 +16,13 @@ Validate workflow configs and filters
 from __future__ import annotations
 
 import unittest
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time
-from time import sleep
+from time import monotonic, sleep
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from metadata.data_insight.api.workflow import DataInsightWorkflow
 from metadata.data_insight.helper.data_insight_es_index import DataInsightEsIndex
@@ -71,34 +72,72 @@ data_insight_config = {
     },
 }
 
-
+# ES probes only need the hit count: skip document fetch and trim the payload
+ES_COUNT_QUERY = "_search?size=0&filter_path=hits.total.value&track_total_hits=true"
+
+
+def _wait_for_index(
+    session: requests.Session, url: str, timeout: float = 10, interval: float = 0.05
+) -> dict:
+    """Poll an ES `_search` endpoint until it returns hits
+
+    Args:
+        session: http session used to query ES
+        url: ES search url to poll
+        timeout: max number of seconds to wait for
+        interval: number of seconds between two polls
+
+    Returns:
+        the last ES response body
+    """
+    deadline = monotonic() + timeout
+    while True:
+        response = session.get(url, timeout=5)
+        if response.ok:
+            body = response.json()
+            if body["hits"]["total"]["value"] > 0:
+                return body
+        if monotonic() >= deadline:
+            raise TimeoutError(f"No data indexed in [{url}] after {timeout}s")
+        sleep(interval)
+
+
+@pytest.mark.xdist_group(name="data_insight")
 class DataInsightWorkflowTests(unittest.TestCase):
-    """Test class for data insight workflow validation"""
+    """Test class for data insight workflow validation.
+
+    Tests share the KPIs and ES indexes created by the workflow,
+    so they are kept on the same worker when running with
+    `pytest -n <N> --dist loadgroup`. Other xdist modes will still
+    split them across workers.
+    """
 
     @classmethod
     def setUpClass(cls) -> None:
         """Set up om client for the test class"""
 
+        # reuse connections across the ES probes
+        cls._http = requests.Session()
+        cls._http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
         cls.metadata = OpenMetadata(
             OpenMetadataConnection.parse_obj(
                 data_insight_config["workflowConfig"]["openMetadataServerConfig"]
             )
         )
 
-        cls.start_ts = int(
-            datetime.combine(datetime.utcnow(), time.min).timestamp() * 1000
-        )
-        cls.end_ts = int(
-            datetime.combine(datetime.utcnow(), time.max).timestamp() * 1000
-        )
+        # derive both bounds from the same date to avoid crossing midnight
+        today = datetime.utcnow().date()
+        cls.start_ts = int(datetime.combine(today, time.min).timestamp() * 1000)
+        cls.end_ts = int(datetime.combine(today, time.max).timestamp() * 1000)
 
-        completed_description_chart = cls.metadata.get_by_name(
+        cls.completed_description_chart = cls.metadata.get_by_name(
             DataInsightChart, "PercentageOfEntitiesWithDescriptionByType", fields="*"
         )
         create = CreateKpiRequest(
             name="CompletedDescription",
             dataInsightChart=EntityReference(
-                type="dataInsightChart", id=completed_description_chart.id
+                type="dataInsightChart", id=cls.completed_description_chart.id
             ),
             description="foo",
             startDate=cls.start_ts,
@@ -116,8 +155,13 @@ class DataInsightWorkflowTests(unittest.TestCase):
         DataInsightWorkflow.create(data_insight_config)
 
         with pytest.raises(ParsingConfigurationError):
-            insight = deepcopy(data_insight_config)
-            insight["source"]["sourceConfig"]["config"].update({"type": "Foo"})
+            insight = {
+                **data_insight_config,
+                "source": {
+                    **data_insight_config["source"],
+                    "sourceConfig": {"config": {"type": "Foo"}},
+                },
+            }
             DataInsightWorkflow.create(insight)
 
     def test_execute_method(self):
@@ -125,52 +169,60 @@ class DataInsightWorkflowTests(unittest.TestCase):
         workflow: DataInsightWorkflow = DataInsightWorkflow.create(data_insight_config)
         workflow.execute()
 
-        sleep(1)  # wait for data to be available
-
-        # Test the indexes have been created as expected and the data have been loaded
-        entity_report_indexes = requests.get(
-            "http://localhost:9200/entity_report_data_index/_search", timeout=30
-        )
-        requests.get(
-            "http://localhost:9200/entity_report_data_index/_search", timeout=30
-        )
-        requests.get(
-            "http://localhost:9200/web_analytic_entity_view_report_data/_search",
-            timeout=30,
-        )
-        assert (
-            entity_report_indexes.json()["hits"]["total"]["value"] > 0
-        )  # check data have been correctly indexed in ES
+        # Test the indexes have been created as expected and the data have been loaded.
+        # ES probes and the report endpoint are independent, run them concurrently.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            entity_report_future = executor.submit(
+                # wait for data to be available: raises if nothing gets
+                # indexed in ES, which checks the workflow loaded the data
+                _wait_for_index,
+                self._http,
+                "http://localhost:9200/entity_report_data_index/"
+                f"{ES_COUNT_QUERY}",
+            )
+            web_analytic_future = executor.submit(
+                self._http.get,
+                "http://localhost:9200/web_analytic_entity_view_report_data/"
+                f"{ES_COUNT_QUERY}",
+                timeout=30,
+            )
+            report_data_future = executor.submit(
+                self.metadata.get_data_insight_report_data,
+                self.start_ts,
+                self.end_ts,
+                ReportDataType.EntityReportData.value,
+            )
+            entity_report_future.result()
+            web_analytic_future.result()
+            report_data = report_data_future.result()
 
         # test report endpoint is returning data
-        report_data = self.metadata.get_data_insight_report_data(
-            self.start_ts,
-            self.end_ts,
-            ReportDataType.EntityReportData.value,
-        )
         assert report_data.get("data")
 
         # test data insight aggregation endpoint is returning data
-        resp = self.metadata.get_aggregated_data_insight_results(
-            start_ts=self.start_ts,
-            end_ts=self.end_ts,
-            data_insight_chart_nane=DataInsightChartType.PercentageOfEntitiesWithDescriptionByType.value,
-            data_report_index=DataInsightEsIndex.EntityReportData.value,
-        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            description_future, owner_future = (
+                executor.submit(
+                    self.metadata.get_aggregated_data_insight_results,
+                    start_ts=self.start_ts,
+                    end_ts=self.end_ts,
+                    data_insight_chart_nane=chart_type.value,
+                    data_report_index=DataInsightEsIndex.EntityReportData.value,
+                )
+                for chart_type in (
+                    DataInsightChartType.PercentageOfEntitiesWithDescriptionByType,
+                    DataInsightChartType.PercentageOfEntitiesWithOwnerByType,
+                )
+            )
+            resp = description_future.result()
+            owner_resp = owner_future.result()
 
         assert isinstance(resp, DataInsightChartResult)
         assert resp.data
         assert isinstance(resp.data[0], PercentageOfEntitiesWithDescriptionByType)
 
-        resp = self.metadata.get_aggregated_data_insight_results(
-            start_ts=self.start_ts,
-            end_ts=self.end_ts,
-            data_insight_chart_nane=DataInsightChartType.PercentageOfEntitiesWithOwnerByType.value,
-            data_report_index=DataInsightEsIndex.EntityReportData.value,
-        )
-
-        assert resp.data
-        assert isinstance(resp.data[0], PercentageOfEntitiesWithOwnerByType)
+        assert owner_resp.data
+        assert isinstance(owner_resp.data[0], PercentageOfEntitiesWithOwnerByType)
 
     def test_get_kpis(self):
         """test Kpis are returned as expected"""
@@ -205,13 +257,10 @@ class DataInsightWorkflowTests(unittest.TestCase):
         assert kpi_result
 
     def test_create_kpi(self):
-        completed_description_chart = self.metadata.get_by_name(
-            DataInsightChart, "PercentageOfEntitiesWithDescriptionByType", fields="*"
-        )
         create = CreateKpiRequest(
             name="myKpi",
             dataInsightChart=EntityReference(
-                type="dataInsightChart", id=completed_description_chart.id
+                type="dataInsightChart", id=self.completed_description_chart.id
             ),
             description="foo",
             startDate=self.start_ts,
@@ -232,10 +281,18 @@ class DataInsightWorkflowTests(unittest.TestCase):
             entity=Kpi, fields="*"  # type: ignore
         ).entities
 
-        for kpi in kpis:
-            cls.metadata.delete(
-                entity=Kpi,
-                entity_id=kpi.id,
-                hard_delete=True,
-                recursive=True,
+        # KPIs are independent from each other, delete them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda kpi: cls.metadata.delete(
+                        entity=Kpi,
+                        entity_id=kpi.id,
+                        hard_delete=True,
+                        recursive=True,
+                    ),
+                    kpis,
+                )
             )
+
+        cls._http.close()
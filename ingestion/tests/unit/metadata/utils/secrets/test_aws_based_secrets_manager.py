@@ -0,0 +1,147 @@
+#  Copyright 2022 Collate
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  http://www.apache.org/licenses/LICENSE-2.0
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Test AWS based Secrets Manager
+"""
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.generated.schema.security.credentials.awsCredentials import AWSCredentials
+from metadata.utils.secrets.aws_based_secrets_manager import CACHE_TTL, _build_client
+from metadata.utils.secrets.aws_secrets_manager import AWSSecretsManager
+from metadata.utils.secrets.aws_ssm_secrets_manager import AWSSSMSecretsManager
+from metadata.utils.singleton import Singleton
+
+
+class TestAWSBasedSecretsManager(TestCase):
+    @classmethod
+    def setUp(cls) -> None:
+        Singleton.clear_all()
+        _build_client.cache_clear()
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_client_is_cached(self, mocked_session):
+        credentials = AWSCredentials(awsRegion="test", awsSecretAccessKey="test")
+
+        first = AWSSecretsManager(credentials)
+        Singleton.clear_all()
+        second = AWSSecretsManager(credentials.copy())
+
+        assert first.client is second.client
+        mocked_session.return_value.client.assert_called_once_with(
+            service_name="secretsmanager"
+        )
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_client_is_cached_by_credentials_and_service(self, mocked_session):
+        AWSSecretsManager(AWSCredentials(awsRegion="test"))
+        Singleton.clear_all()
+        AWSSecretsManager(AWSCredentials(awsRegion="other"))
+        Singleton.clear_all()
+        AWSSSMSecretsManager(AWSCredentials(awsRegion="test"))
+
+        assert mocked_session.return_value.client.call_count == 3
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_get_string_values(self, _):
+        secrets_manager = AWSSecretsManager(AWSCredentials(awsRegion="test"))
+        secrets_manager.client = MagicMock()
+        secrets_manager.client.get_secret_value.side_effect = lambda SecretId: {
+            "SecretString": f"{SecretId}-value"
+        }
+
+        values = secrets_manager.get_string_values(["foo", "bar", "foo"])
+
+        assert values == {"foo": "foo-value", "bar": "bar-value"}
+        assert secrets_manager.client.get_secret_value.call_count == 2
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_ssm_get_string_values_in_batches(self, _):
+        secrets_manager = AWSSSMSecretsManager(AWSCredentials(awsRegion="test"))
+        secrets_manager.client = MagicMock()
+        secrets_manager.client.get_parameters.side_effect = lambda Names, **_: {
+            "Parameters": [{"Name": name, "Value": f"{name}-value"} for name in Names]
+        }
+        names = [f"param{index}" for index in range(15)]
+
+        values = secrets_manager.get_string_values(names)
+
+        assert values == {name: f"{name}-value" for name in names}
+        assert secrets_manager.client.get_parameters.call_count == 2
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_ssm_get_string_values_with_selector(self, _):
+        secrets_manager = AWSSSMSecretsManager(AWSCredentials(awsRegion="test"))
+        secrets_manager.client = MagicMock()
+        secrets_manager.client.get_parameters.return_value = {
+            "Parameters": [
+                {"Name": "/app/db", "Selector": ":2", "Value": "versioned"},
+                {"Name": "/app/user", "Selector": ":prod", "Value": "labeled"},
+                {"Name": "/app/host", "Value": "plain"},
+            ],
+        }
+
+        values = secrets_manager.get_string_values(
+            ["/app/db:2", "/app/user:prod", "/app/host"]
+        )
+
+        assert values == {
+            "/app/db:2": "versioned",
+            "/app/user:prod": "labeled",
+            "/app/host": "plain",
+        }
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_ssm_get_string_values_missing_parameter(self, _):
+        secrets_manager = AWSSSMSecretsManager(AWSCredentials(awsRegion="test"))
+        secrets_manager.client = MagicMock()
+        secrets_manager.client.get_parameters.return_value = {
+            "Parameters": [{"Name": "foo", "Value": "foo-value"}],
+            "InvalidParameters": ["bar"],
+        }
+
+        with self.assertRaises(ValueError):
+            secrets_manager.get_string_values(["foo", "bar"])
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_get_string_value_is_cached(self, _):
+        secrets_manager = AWSSecretsManager(AWSCredentials(awsRegion="test"))
+        secrets_manager.client = MagicMock()
+        secrets_manager.client.get_secret_value.return_value = {"SecretString": "old"}
+
+        assert secrets_manager.get_string_value("foo") == "old"
+        assert secrets_manager.get_string_values(["foo"]) == {"foo": "old"}
+        secrets_manager.client.get_secret_value.assert_called_once()
+
+        secrets_manager.client.get_secret_value.return_value = {"SecretString": "new"}
+        assert secrets_manager.refresh_now("foo") == "new"
+        assert secrets_manager.get_string_value("foo") == "new"
+        assert secrets_manager.client.get_secret_value.call_count == 2
+
+    @patch("metadata.clients.aws_client.Session")
+    def test_get_string_value_cache_expires(self, _):
+        secrets_manager = AWSSecretsManager(AWSCredentials(awsRegion="test"))
+        secrets_manager.client = MagicMock()
+        secrets_manager.client.get_secret_value.return_value = {"SecretString": "foo"}
+
+        with patch(
+            "metadata.utils.secrets.aws_based_secrets_manager.monotonic"
+        ) as mocked_monotonic:
+            mocked_monotonic.return_value = 0
+            secrets_manager.get_string_value("foo")
+            mocked_monotonic.return_value = CACHE_TTL - 1
+            secrets_manager.get_string_value("foo")
+            assert secrets_manager.client.get_secret_value.call_count == 1
+
+            mocked_monotonic.return_value = CACHE_TTL + 1
+            secrets_manager.get_string_value("foo")
+            assert secrets_manager.client.get_secret_value.call_count == 2